@@ -2,44 +2,72 @@
 
 import asyncio
 import aiohttp
-import json
 import logging
+import orjson
 from pathlib import Path
-from typing import Dict, Any, Optional
+from collections import defaultdict
+from functools import partial
+from typing import DefaultDict, Dict, Any, List, Optional
 import time
+from yarl import URL
 
 from config import DataConfig
 from exceptions import DataProcessingError
+from utils.files import write_bytes_atomic
 
 logger = logging.getLogger(__name__)
 
+# Encoder for the pretty-printed JSON files written by the mapper
+_dump_indented = partial(
+    orjson.dumps, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+)
+
 
 class MOApiMapper:
     """Maps and tests Mushroom Observer API endpoints."""
 
     BASE_URL = "https://mushroomobserver.org/api2"
-    REQUEST_DELAY = 20  # seconds between requests
+    REQUEST_DELAY = 20  # average seconds per request (token refill interval)
+    REQUEST_BURST = 4  # requests that may go out back to back when idle
+    MAX_CONCURRENT_REQUESTS = 4  # requests awaiting a response at once
+    HELP_CACHE_TTL = 7 * 86400  # seconds; help output only changes with API releases
+    # Record types listed in example_ids.json, even when none were discovered
+    EXAMPLE_ID_TYPES = (
+        "names",
+        "observations",
+        "images",
+        "locations",
+        "sequences",
+        "external_links",
+    )
 
     def __init__(self, config: DataConfig, output_dir: Path):
         self.config = config
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.session: Optional[aiohttp.ClientSession] = None
-        self.last_request_time = 0
+        self._request_slots = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._rate_lock = asyncio.Lock()
+        self._tokens: float = self.REQUEST_BURST
+        self._last_refill = time.monotonic()
+        self._endpoint_urls: Dict[str, URL] = {}
 
         # Store discovered IDs
-        self.example_ids = {
-            "names": [],
-            "observations": [],
-            "images": [],
-            "locations": [],
-            "sequences": [],
-            "external_links": [],
-        }
+        self.example_ids: DefaultDict[str, List[int]] = defaultdict(
+            list, {id_type: [] for id_type in self.EXAMPLE_ID_TYPES}
+        )
 
     async def __aenter__(self):
         """Set up async context."""
-        self.session = aiohttp.ClientSession(headers={"Accept": "application/json"})
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.MAX_CONCURRENT_REQUESTS,
+            keepalive_timeout=120,  # outlive the gap between rate-limited requests
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector, headers={"Accept": "application/json"}
+        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -47,36 +75,59 @@ class MOApiMapper:
         if self.session:
             await self.session.close()
 
+    async def _wait_for_rate_limit(self) -> None:
+        """Take a token from the rate-limit bucket, waiting for a refill if empty."""
+        async with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.REQUEST_BURST,
+                self._tokens + (now - self._last_refill) / self.REQUEST_DELAY,
+            )
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            # Sleep until one token has refilled and spend it straight away
+            await asyncio.sleep((1 - self._tokens) * self.REQUEST_DELAY)
+            self._tokens = 0
+            self._last_refill = time.monotonic()
+
+    def _endpoint_url(self, endpoint: str) -> URL:
+        """Return the parsed URL for an endpoint, building it on first use."""
+        url = self._endpoint_urls.get(endpoint)
+        if url is None:
+            url = self._endpoint_urls[endpoint] = URL(self.BASE_URL) / endpoint
+        return url
+
     async def _make_request(
         self, endpoint: str, params: Dict[str, str]
     ) -> Dict[str, Any]:
-        """Make API request with rate limiting."""
+        """Make API request with rate limiting.
+
+        Safe to call concurrently: callers may run several requests at once and
+        the shared token bucket paces them against the server's rate limit.
+        """
         if not self.session:
             raise DataProcessingError("No active session")
 
-        # Enforce rate limiting
-        now = time.time()
-        time_since_last = now - self.last_request_time
-        if time_since_last < self.REQUEST_DELAY:
-            await asyncio.sleep(self.REQUEST_DELAY - time_since_last)
-
         # Always request JSON format
         params["format"] = "json"
 
-        url = f"{self.BASE_URL}/{endpoint}"
-        try:
-            async with self.session.get(url, params=params) as response:
-                self.last_request_time = time.time()
-
-                if response.status != 200:
-                    raise DataProcessingError(
-                        f"API request failed: {response.status} - {await response.text()}"
-                    )
+        url = self._endpoint_url(endpoint)
+        async with self._request_slots:
+            await self._wait_for_rate_limit()
+            try:
+                async with self.session.get(url, params=params) as response:
+                    if response.status != 200:
+                        raise DataProcessingError(
+                            f"API request failed: {response.status} - {await response.text()}"
+                        )
 
-                return await response.json()
+                    return orjson.loads(await response.read())
 
-        except Exception as e:
-            raise DataProcessingError(f"API request failed: {str(e)}")
+            except Exception as e:
+                raise DataProcessingError(f"API request failed: {str(e)}")
 
     async def test_endpoint(
         self, endpoint: str, params: Dict[str, str], save_as: str
@@ -86,11 +137,36 @@ class MOApiMapper:
 
         # Save response to file
         output_file = self.output_dir / f"{save_as}.json"
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(response, f, indent=2)
+        await asyncio.to_thread(output_file.write_bytes, _dump_indented(response))
 
         return response
 
+    async def cached_test_endpoint(
+        self, endpoint: str, params: Dict[str, str], save_as: str, ttl: float
+    ) -> Dict[str, Any]:
+        """Like test_endpoint, but reuse a saved response younger than ttl seconds."""
+        output_file = self.output_dir / f"{save_as}.json"
+        try:
+            if time.time() - output_file.stat().st_mtime < ttl:
+                logger.info(f"Using cached response: {output_file.name}")
+                return orjson.loads(await asyncio.to_thread(output_file.read_bytes))
+        except (OSError, orjson.JSONDecodeError):
+            pass  # Missing or unreadable cache; fetch a fresh copy
+
+        return await self.test_endpoint(endpoint, params, save_as)
+
+    @staticmethod
+    def _result_ids(response: Dict[str, Any], limit: int) -> List[int]:
+        """Return up to limit record ids from a response's results.
+
+        Depending on the detail level the API returns either bare ids or
+        records; only the ids are kept.
+        """
+        return [
+            r["id"] if isinstance(r, dict) else r
+            for r in response.get("results", [])[:limit]
+        ]
+
     async def discover_ids(self):
         """Get example IDs for each main data type."""
         logger.info("Discovering example IDs...")
@@ -100,39 +176,50 @@ class MOApiMapper:
             "observations", {"names": "Agaricus", "detail": "low", "has_images": "true"}
         )
         if "results" in response:
-            self.example_ids["observations"] = response["results"][:5]
-
-            # Get associated images
-            for obs_id in self.example_ids["observations"]:
-                img_response = await self._make_request(
-                    "images", {"observation_id": str(obs_id), "detail": "low"}
+            self.example_ids["observations"] = self._result_ids(response, 5)
+
+            # Get associated images. If one request fails, the task group
+            # cancels and awaits the others before the error is reported.
+            try:
+                async with asyncio.TaskGroup() as group:
+                    img_tasks = [
+                        group.create_task(
+                            self._make_request(
+                                "images",
+                                {"observation_id": str(obs_id), "detail": "low"},
+                            )
+                        )
+                        for obs_id in self.example_ids["observations"]
+                    ]
+            except ExceptionGroup as e:
+                raise e.exceptions[0] from e
+            for img_task in img_tasks:
+                self.example_ids["images"].extend(
+                    self._result_ids(img_task.result(), 2)
                 )
-                if "results" in img_response:
-                    self.example_ids["images"].extend(img_response["results"][:2])
 
         # Get some name IDs
         response = await self._make_request(
             "names", {"children_of": "Agaricus", "detail": "low"}
         )
         if "results" in response:
-            self.example_ids["names"] = response["results"][:5]
+            self.example_ids["names"] = self._result_ids(response, 5)
 
         # Get some location IDs
         response = await self._make_request("locations", {"detail": "low"})
         if "results" in response:
-            self.example_ids["locations"] = response["results"][:5]
+            self.example_ids["locations"] = self._result_ids(response, 5)
 
         # Save discovered IDs
-        with open(self.output_dir / "example_ids.json", "w") as f:
-            json.dump(self.example_ids, f, indent=2)
+        ids_file = self.output_dir / "example_ids.json"
+        await asyncio.to_thread(
+            write_bytes_atomic, ids_file, _dump_indented(self.example_ids)
+        )
 
         logger.info("Discovered IDs: %s", self.example_ids)
 
     async def map_endpoints(self):
         """Map and test all relevant API endpoints."""
-        # First discover some valid IDs
-        await self.discover_ids()
-
         # Get API parameter documentation
         help_endpoints = [
             {"endpoint": name, "params": {"help": "1"}, "save_as": f"{name}_help"}
@@ -146,14 +233,23 @@ class MOApiMapper:
             ]
         ]
 
-        # Test each help endpoint
-        for endpoint_info in help_endpoints:
-            logger.info(f"Getting help for: {endpoint_info['endpoint']}")
-            await self.test_endpoint(
-                endpoint_info["endpoint"],
-                endpoint_info["params"],
-                endpoint_info["save_as"],
-            )
+        # Help output doesn't depend on discovered IDs, so fetch it alongside
+        endpoint_names = ", ".join(e["endpoint"] for e in help_endpoints)
+        logger.info(f"Getting help for: {endpoint_names}")
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self.discover_ids())
+                for endpoint_info in help_endpoints:
+                    group.create_task(
+                        self.cached_test_endpoint(
+                            endpoint_info["endpoint"],
+                            endpoint_info["params"],
+                            endpoint_info["save_as"],
+                            ttl=self.HELP_CACHE_TTL,
+                        )
+                    )
+        except ExceptionGroup as e:
+            raise e.exceptions[0] from e
 
         # Test detailed data endpoints
         if self.example_ids["names"]:
@@ -211,13 +307,32 @@ class MOApiMapper:
                 "params": {"rank": "Species", "has_images": "true", "detail": "high"},
                 "save_as": "names_species_with_images",
             },
+            # Sequences and external links with filters
+            {
+                "endpoint": "sequences",
+                "params": {
+                    "locus": "ITS",  # Internal Transcribed Spacer region
+                    "detail": "high",
+                },
+                "save_as": "sequences_its",
+            },
+            {
+                "endpoint": "external_links",
+                "params": {"site": "Index Fungorum", "detail": "high"},
+                "save_as": "external_links_index_fungorum",
+            },
         ]
 
-        for query in special_queries:
-            logger.info(f"Testing special query: {query['save_as']}")
-            await self.test_endpoint(
-                query["endpoint"], query["params"], query["save_as"]
-            )
+        query_names = ", ".join(q["save_as"] for q in special_queries)
+        logger.info(f"Testing special queries: {query_names}")
+        try:
+            async with asyncio.TaskGroup() as group:
+                for q in special_queries:
+                    group.create_task(
+                        self.test_endpoint(q["endpoint"], q["params"], q["save_as"])
+                    )
+        except ExceptionGroup as e:
+            raise e.exceptions[0] from e
 
         # Test sequences endpoint
         await self.test_endpoint(
@@ -240,29 +355,6 @@ class MOApiMapper:
                 "external_links_for_obs",
             )
 
-        # Test sequences with filters
-        special_queries = [
-            {
-                "endpoint": "sequences",
-                "params": {
-                    "locus": "ITS",  # Internal Transcribed Spacer region
-                    "detail": "high",
-                },
-                "save_as": "sequences_its",
-            },
-            {
-                "endpoint": "external_links",
-                "params": {"site": "Index Fungorum", "detail": "high"},
-                "save_as": "external_links_index_fungorum",
-            },
-        ]
-
-        for query in special_queries:
-            logger.info(f"Testing special query: {query['save_as']}")
-            await self.test_endpoint(
-                query["endpoint"], query["params"], query["save_as"]
-            )
-
 
 async def main():
     """Main execution function."""
@@ -275,4 +367,11 @@ async def main():
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None  # uvloop is optional; use the default event loop
+    else:
+        loop_factory = uvloop.new_event_loop
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
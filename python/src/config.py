@@ -1,5 +1,6 @@
 """Configuration management using Pydantic."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Tuple, List
 from pydantic import Field, field_validator
@@ -13,41 +14,21 @@ class MODataSource:
 
     BASE_URL = "https://mushroomobserver.org"
 
-    def __init__(self):
-        """
-        Initialize the MODataSource class with URLs for various data sources.
+    # Core data
+    OBSERVATIONS = f"{BASE_URL}/observations.csv"
+    NAMES = f"{BASE_URL}/names.csv"
+    LOCATIONS = f"{BASE_URL}/locations.csv"
+    IMAGES = f"{BASE_URL}/images.csv"
 
-        This method sets up the URLs for different datasets available from the Mushroom Observer website.
-        Each URL corresponds to a specific CSV file containing relevant data.
+    # Relationships
+    IMAGES_OBSERVATIONS = f"{BASE_URL}/images_observations.csv"
 
-        - Core Data:
-            - OBSERVATIONS: URL for the observations dataset.
-            - NAMES: URL for the names dataset.
-            - LOCATIONS: URL for the locations dataset.
-            - IMAGES: URL for the images dataset.
-        - Relationships:
-            - IMAGES_OBSERVATIONS: URL for the dataset linking images to observations.
+    # Taxonomic data
+    NAME_CLASSIFICATIONS = f"{BASE_URL}/name_classifications.csv"
+    NAME_DESCRIPTIONS = f"{BASE_URL}/name_descriptions.csv"
 
-        - Taxonomic Data:
-            - NAME_CLASSIFICATIONS: URL for the dataset containing taxonomic classifications of names.
-            - NAME_DESCRIPTIONS: URL for the dataset containing descriptions of names.
-        - Location Data:
-            - LOCATION_DESCRIPTIONS: URL for the dataset containing descriptions of locations.
-        """
-        self.OBSERVATIONS = f"{self.BASE_URL}/observations.csv"
-        self.NAMES = f"{self.BASE_URL}/names.csv"
-        self.LOCATIONS = f"{self.BASE_URL}/locations.csv"
-        self.IMAGES = f"{self.BASE_URL}/images.csv"
-
-        # Relationships
-        self.IMAGES_OBSERVATIONS = f"{self.BASE_URL}/images_observations.csv"
-
-        # Taxonomic data
-        self.NAME_CLASSIFICATIONS = f"{self.BASE_URL}/name_classifications.csv"
-        self.NAME_DESCRIPTIONS = f"{self.BASE_URL}/name_descriptions.csv"
-
-        # Location data
-        self.LOCATION_DESCRIPTIONS = f"{self.BASE_URL}/location_descriptions.csv"
+    # Location data
+    LOCATION_DESCRIPTIONS = f"{BASE_URL}/location_descriptions.csv"
 
 
 class DataConfig(BaseSettings):
@@ -61,6 +42,9 @@ class DataConfig(BaseSettings):
     BATCH_SIZE: int = Field(
         1000, ge=1, description="Batch size for database operations"
     )
+    MAX_CONCURRENT_WRITES: int = Field(
+        8, ge=1, description="Maximum number of bulk writes in flight at once"
+    )
 
     # File settings
     DEFAULT_DELIMITER: str = Field("\t", description="Default delimiter for CSV files")
@@ -83,6 +67,15 @@ class DataConfig(BaseSettings):
     CHUNK_SIZE: int = Field(
         8192, description="Chunk size in bytes for file downloads"
     )  # bytes for file download
+    DOWNLOAD_TIMEOUT: int = Field(
+        30, ge=1, description="Seconds a download may go without receiving data"
+    )
+    CONNECTION_POOL_SIZE: int = Field(
+        16, ge=1, description="Maximum number of pooled HTTP connections"
+    )
+    MAX_CONCURRENT_DOWNLOADS: int = Field(
+        4, ge=1, description="Maximum number of files downloaded at once"
+    )
 
     # MongoDB indexes
     INDEXES: Dict[str, List[Dict[str, Any]]] = Field(
@@ -150,8 +143,15 @@ class DataConfig(BaseSettings):
 
     @field_validator("DATA_DIR")
     def validate_data_dir(cls, v: Path) -> Path:
-        v.mkdir(parents=True, exist_ok=True)
-        return v
+        # Created lazily by ensure_dir() when something is first written there
+        return v.absolute()
+
+
+@lru_cache(maxsize=None)
+def ensure_dir(path: Path) -> Path:
+    """Create a directory once per process and return it."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 def load_yaml_config(path: Path) -> Dict[str, Any]:
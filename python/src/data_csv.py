@@ -1,15 +1,25 @@
 import asyncio
 import logging
+import multiprocessing
+import os
 import time
+from collections import Counter, deque
+from contextlib import nullcontext
+from concurrent.futures import Executor, ProcessPoolExecutor
 from abc import ABC, abstractmethod
-from functools import wraps
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache, wraps
 from pathlib import Path
 from typing import (
     Any,
     AsyncGenerator,
+    ContextManager,
+    Deque,
     Dict,
     List,
     Optional,
+    Sequence,
     Set,
     Tuple,
 )
@@ -18,12 +28,11 @@ import pandas as pd
 import yaml
 from aiohttp import ClientSession
 from pydantic import BaseModel, DirectoryPath, Field, HttpUrl
-from pymongo import MongoClient
+from pymongo import InsertOne, MongoClient, ReplaceOne
 from pymongo.collection import Collection
 from pymongo.database import Database
 from dotenv import load_dotenv
 
-load_dotenv()
 
 # --- Configuration Classes ---
 class DataConfig(BaseModel):
@@ -36,6 +45,9 @@ class DataConfig(BaseModel):
     date_format: str = Field("%Y-%m-%d", description="Date parsing format")
     schemas: List[str] = Field(..., description="List of schema names")
     batch_size: int = Field(1000, ge=1, description="Processing batch size")
+    validation_workers: Optional[int] = Field(
+        None, ge=1, description="Validation worker processes (default: CPU count)"
+    )
     default_delimiter: str = Field(",", min_length=1, description="CSV delimiter")
     null_values: Set[str] = Field(
         default_factory=lambda: {"", "NA", "NULL", "None"},
@@ -207,26 +219,15 @@ class DatabaseManager:
         if not data:
             return
 
-        insert_data = []
-        update_operations = []
-        for record in data:
-            if "_id" in record:
-                update_operations.append(
-                    {
-                        "replaceOne": {
-                            "filter": {"_id": record["_id"]},
-                            "replacement": record,
-                            "upsert": True,
-                        }
-                    }
-                )
-            else:
-                insert_data.append(record)
-
-        if insert_data:
-            await collection.insert_many(insert_data)
-        if update_operations:
-            await collection.bulk_write(update_operations)
+        # Inserts and replacements travel together in a single unordered
+        # bulk write, so each batch costs one round-trip to the server.
+        operations = [
+            ReplaceOne({"_id": record["_id"]}, record, upsert=True)
+            if "_id" in record
+            else InsertOne(record)
+            for record in data
+        ]
+        await asyncio.to_thread(collection.bulk_write, operations, ordered=False)
 
     def get_collection(self, name: str) -> Collection:
         """Get a MongoDB collection."""
@@ -247,6 +248,39 @@ class Validator(ABC):
         pass
 
 
+# Whole days representable as a pandas Timestamp (1677-09-22 to 2262-04-11)
+_MIN_TIMESTAMP_DATE = pd.Timestamp.min.ceil("D").date()
+_MAX_TIMESTAMP_DATE = pd.Timestamp.max.floor("D").date()
+
+
+def _is_valid_date(value: Any, date_format: str) -> bool:
+    """Check whether a value parses as a date in the given format."""
+    if (
+        date_format == "%Y-%m-%d"
+        and isinstance(value, str)
+        and len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+    ):
+        # Fixed-width ISO dates are parsed in C without format matching, but
+        # must still fit in a pandas Timestamp as the slow path requires.
+        try:
+            return (
+                _MIN_TIMESTAMP_DATE <= date.fromisoformat(value) <= _MAX_TIMESTAMP_DATE
+            )
+        except ValueError:
+            return False
+    try:
+        pd.to_datetime(value, format=date_format, errors="raise")
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+# CSV date columns repeat heavily, so string inputs go through a memo
+_is_valid_date_str = lru_cache(maxsize=8192)(_is_valid_date)
+
+
 class DateValidator(Validator):
     """Validator for date strings."""
 
@@ -257,11 +291,11 @@ class DateValidator(Validator):
         """Validate a date string."""
         if value is None:
             return True, ""
-        try:
-            pd.to_datetime(value, format=self.date_format, errors="raise")
-            return True, ""
-        except (ValueError, TypeError):
-            return False, f"Invalid date format: {value}"
+        if isinstance(value, str):
+            valid = _is_valid_date_str(value, self.date_format)
+        else:
+            valid = _is_valid_date(value, self.date_format)
+        return (True, "") if valid else (False, f"Invalid date format: {value}")
 
 
 class LocationValidator(Validator):
@@ -337,13 +371,18 @@ class FloatValidator(Validator):
 
 
 # --- Validation Functions ---
-class ValidationResult(BaseModel):
-    """Represents the result of a validation."""
+@dataclass(slots=True)
+class ValidationResult:
+    """Represents the result of a validation.
+
+    Built once per CSV row, so this is a slotted dataclass rather than a
+    pydantic model: no re-validation or copy of ``record`` on construction.
+    """
 
-    is_valid: bool = Field(..., description="Whether validation passed")
-    errors: List[str] = Field(default_factory=list, description="Validation errors")
-    warnings: List[str] = Field(default_factory=list, description="Validation warnings")
-    record: Optional[Dict[str, Any]] = Field(None, description="Validated record")
+    is_valid: bool
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    record: Optional[Dict[str, Any]] = None
 
     @property
     def has_warnings(self) -> bool:
@@ -379,49 +418,45 @@ def validate_with_schema(
             whether the data is valid, a list of error messages, and a list of
             warnings for unknown validators.
     """
-    errors = []
-    warnings = []
-    is_valid = True
-
-    for field, field_schema in schema.items():
-        if "validators" in field_schema:
-            is_valid, errors, warnings = _validate_field(
-                field, field_schema, data, validators, is_valid, errors, warnings
+    return validate_compiled(data, compile_schema(schema, validators))
+
+
+# A schema resolved against its validators: (field, validator name, validator).
+CompiledSchema = List[Tuple[str, str, Optional[Validator]]]
+
+
+def compile_schema(
+    schema: Dict[str, Any], validators: Dict[str, Validator]
+) -> CompiledSchema:
+    """Resolve each field's validators once, ahead of per-record validation."""
+    return [
+        (field_name, validator_name, validators.get(validator_name))
+        for field_name, field_schema in schema.items()
+        for validator_name in field_schema.get("validators", ())
+    ]
+
+
+def validate_compiled(
+    data: Dict[str, Any], compiled: CompiledSchema
+) -> ValidationResult:
+    """Validate data against a schema already resolved by compile_schema."""
+    errors: List[str] = []
+    warnings: List[str] = []
+    for field_name, validator_name, validator in compiled:
+        if validator is None:
+            warnings.append(
+                f"Unknown validator: {validator_name} for field {field_name}"
             )
+            continue
+        valid, error_message = validator.validate(data.get(field_name))
+        if not valid:
+            errors.append(f"Field '{field_name}': {error_message}")
 
     return ValidationResult(
-        is_valid=is_valid, errors=errors, warnings=warnings, record=data
+        is_valid=not errors, errors=errors, warnings=warnings, record=data
     )
 
 
-def _validate_field(
-    field: str,
-    field_schema: Dict[str, Any],
-    data: Dict[str, Any],
-    validators: Dict[str, Validator],
-    is_valid: bool,
-    errors: List[str],
-    warnings: List[str],
-) -> Tuple[bool, List[str], List[str]]:
-    """Validate a single field against its schema."""
-    new_errors = errors[:]
-    new_warnings = warnings[:]
-    new_is_valid = is_valid
-    for validator_name in field_schema["validators"]:
-        validator = validators.get(validator_name)
-        if validator:
-            value = data.get(field)
-            valid, error_message = validator.validate(value)
-            if not valid:
-                new_errors.append(f"Field '{field}': {error_message}")
-                new_is_valid = False
-            else:
-                new_warnings.append(
-                    f"Unknown validator: {validator_name} for field {field}"
-                )
-    return new_is_valid, new_errors, new_warnings
-
-
 def create_validators(config: DataConfig) -> Dict[str, Validator]:
     """Create validator instances."""
     return {
@@ -437,17 +472,79 @@ def create_validators(config: DataConfig) -> Dict[str, Validator]:
 async def process_data_files(
     config: DataConfig, data_files: Dict[str, Path], db_manager: DatabaseManager
 ) -> None:
-    """Process data files and insert into MongoDB."""
+    """Process data files and insert into MongoDB.
+
+    Files are processed concurrently. Validation is CPU-bound, so on
+    multi-CPU hosts batches are validated in a process pool while the event
+    loop keeps reading CSV chunks and writing to MongoDB.
+    """
     validators = create_validators(config)
-    for schema_name, file_path in data_files.items():
-        schema = SCHEMAS.get(schema_name)
-        if not schema:
-            logger.warning(f"No schema found for {schema_name}, skipping")
-            continue
-        collection = db_manager.get_collection(schema_name)
-        await _process_file(
-            config, file_path, schema, validators, collection, db_manager
-        )
+    with _validation_pool(config) as executor:
+        try:
+            # Files are independent, so read, validate and upsert them
+            # concurrently. If one fails, the task group cancels and awaits
+            # the others before the pool is shut down underneath them.
+            async with asyncio.TaskGroup() as group:
+                for schema_name, file_path in data_files.items():
+                    schema = SCHEMAS.get(schema_name)
+                    if not schema:
+                        logger.warning(f"No schema found for {schema_name}, skipping")
+                        continue
+                    collection = db_manager.get_collection(schema_name)
+                    group.create_task(
+                        _process_file(
+                            config,
+                            file_path,
+                            schema,
+                            validators,
+                            collection,
+                            db_manager,
+                            executor,
+                        )
+                    )
+        except ExceptionGroup as e:
+            raise e.exceptions[0] from e
+
+
+def _validation_pool(config: DataConfig) -> ContextManager[Optional[Executor]]:
+    """Return the executor batches are validated in.
+
+    Pickling a batch costs about half as much as validating it, so a process
+    pool only pays off with more than one CPU; otherwise batches are
+    validated on the event loop's default thread pool.
+    """
+    if (os.cpu_count() or 1) <= 1:
+        return nullcontext(None)
+    # CSV chunks are read on worker threads, and forking a process while
+    # other threads are live can deadlock, so start workers from a clean
+    # forkserver where the platform has one.
+    start_method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    return ProcessPoolExecutor(
+        max_workers=config.validation_workers,
+        mp_context=multiprocessing.get_context(start_method),
+    )
+
+
+def _validate_batch(
+    batch: List[Dict[str, Any]], compiled: CompiledSchema
+) -> Tuple[List[Dict[str, Any]], List[Tuple[List[str], Dict[str, Any]]]]:
+    """Split a batch into valid records and (errors, record) failures.
+
+    Module-level so it can be pickled into a worker process.
+    """
+    valid: List[Dict[str, Any]] = []
+    failed: List[Tuple[List[str], Dict[str, Any]]] = []
+    for record in batch:
+        validation_result = validate_compiled(record, compiled)
+        if validation_result.is_valid:
+            valid.append(record)
+        else:
+            failed.append((validation_result.errors, record))
+    return valid, failed
 
 
 async def _process_file(
@@ -457,29 +554,93 @@ async def _process_file(
     validators: Dict[str, Validator],
     collection: Collection,
     db_manager: DatabaseManager,
+    executor: Optional[Executor] = None,
 ) -> None:
     """Process a single data file."""
+    compiled = compile_schema(schema, validators)
+    boolean_columns = [
+        field_name
+        for field_name, field_schema in schema.items()
+        if "boolean" in field_schema.get("validators", ())
+    ]
+    loop = asyncio.get_running_loop()
+    # Keep a few batches validating while the next ones are read, but bound
+    # how many so memory stays flat on large files.
+    max_in_flight = 2 * (config.validation_workers or os.cpu_count() or 1)
+    pending: Deque[asyncio.Future] = deque()
+    stats: Counter = Counter()
+
+    async def upsert_oldest() -> None:
+        validated_batch, failed = await pending.popleft()
+        for errors, record in failed:
+            logger.warning(f"Record failed validation: {errors} in {record}")
+        await db_manager.batch_upsert(collection, validated_batch)
+        stats["valid"] += len(validated_batch)
+        stats["failed"] += len(failed)
+
     try:
-        async for batch in _read_csv_in_batches(config, file_path):
-            validated_batch = []
-            for record in batch:
-                validation_result = validate_with_schema(record, schema, validators)
-                if validation_result.is_valid:
-                    validated_batch.append(record)
-                else:
-                    logger.warning(
-                        f"Record failed validation: {validation_result.errors} in {record}"
-                    )
-            await db_manager.batch_upsert(collection, validated_batch)
+        async for batch in _read_csv_in_batches(
+            config, file_path, boolean_columns, stats
+        ):
+            pending.append(
+                loop.run_in_executor(executor, _validate_batch, batch, compiled)
+            )
+            if len(pending) >= max_in_flight:
+                await upsert_oldest()
+        while pending:
+            await upsert_oldest()
+        logger.info(
+            f"Processed {file_path.name}: {stats['rows']} rows, "
+            f"{stats['valid']} upserted, {stats['failed']} failed validation, "
+            f"{stats['empty_rows']} empty rows skipped"
+        )
     except Exception as e:
         logger.error(f"Error processing {file_path}: {e}")
         raise DataProcessingError(f"Error processing {file_path}: {e}")
+    finally:
+        # Drop batches still queued in the pool so shutting it down does not
+        # block the event loop on work nobody will consume.
+        for future in pending:
+            future.cancel()
+
+
+# Spellings accepted for "boolean" schema fields in CSV input
+_TRUE_STRINGS = frozenset({"true", "t", "1", "yes"})
+_FALSE_STRINGS = frozenset({"false", "f", "0", "no"})
+
+
+def _coerce_booleans(df_chunk: pd.DataFrame, columns: Sequence[str]) -> pd.DataFrame:
+    """Convert recognised boolean spellings to bool, column-wise.
+
+    Unrecognised values are left untouched so BooleanValidator still reports
+    them.
+    """
+    coerced = {}
+    for column in columns:
+        if column not in df_chunk.columns:
+            continue
+        values = df_chunk[column]
+        lowered = values.astype(str).str.strip().str.lower()
+        coerced[column] = (
+            values.astype(object)
+            .mask(lowered.isin(_TRUE_STRINGS), True)
+            .mask(lowered.isin(_FALSE_STRINGS), False)
+        )
+    return df_chunk.assign(**coerced) if coerced else df_chunk
 
 
 async def _read_csv_in_batches(
-    config: DataConfig, file_path: Path
+    config: DataConfig,
+    file_path: Path,
+    boolean_columns: Sequence[str] = (),
+    stats: Optional[Counter] = None,
 ) -> AsyncGenerator[List[Dict[str, Any]], None]:
-    """Read a CSV file in batches."""
+    """Read a CSV file in batches.
+
+    If stats is given, "rows" counts every data row read and "empty_rows"
+    the all-empty rows skipped among them.
+    """
+    stats = Counter() if stats is None else stats
     try:
         df_chunks = pd.read_csv(
             file_path,
@@ -487,8 +648,24 @@ async def _read_csv_in_batches(
             na_values=config.null_values,
             keep_default_na=True,
             encoding="utf-8",
+            # Nullable dtypes keep id columns integer even when values are
+            # missing, instead of widening them to float64 with NaN.
+            dtype_backend="numpy_nullable",
         )
-        for df_chunk in df_chunks:
+        # Parse each chunk on a worker thread so other files keep moving
+        while (df_chunk := await asyncio.to_thread(next, df_chunks, None)) is not None:
+            # Rows of bare delimiters carry no data; drop them before they
+            # reach validation or the database.
+            rows_read = len(df_chunk)
+            df_chunk = df_chunk.dropna(how="all")
+            stats["rows"] += rows_read
+            stats["empty_rows"] += rows_read - len(df_chunk)
+            if df_chunk.empty:
+                continue
+            df_chunk = _coerce_booleans(df_chunk, boolean_columns)
+            # Swap NaN for None once per chunk so validators and MongoDB see
+            # real nulls instead of float NaN in string/id columns.
+            df_chunk = df_chunk.astype(object).where(df_chunk.notna(), None)
             records = df_chunk.to_dict(orient="records")
             yield records
     except Exception as e:
@@ -499,6 +676,7 @@ async def _read_csv_in_batches(
 @measure_performance
 async def main():
     """Main function to run the data pipeline."""
+    load_dotenv()
     logging.basicConfig(
         level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
     )
@@ -2,22 +2,32 @@ import asyncio
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, Set, List
-from datetime import datetime, timedelta
-import json
+from datetime import date, datetime, timedelta
 import shutil
 import aiohttp
 import aiofiles
+import orjson
 from collections import defaultdict
+from functools import lru_cache
 from pydantic import BaseModel, Field
 
-from src.config import DataConfig, MODataSource
+from src.config import DataConfig, MODataSource, ensure_dir
 from src.monitoring import measure_performance
 from src.exceptions import DataProcessingError
+from src.utils.files import write_bytes_atomic
 from src.validation import validate_data
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def parse_date(value: str) -> date:
+    """Parse a ``YYYY-MM-DD`` string, skipping strptime for the canonical shape."""
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        return date.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
 class PipelineStats(BaseModel):
     """Pipeline processing statistics."""
 
@@ -52,13 +62,12 @@ class PipelineProgress:
     def load_progress(self):
         if self.progress_file.exists():
             try:
-                with open(self.progress_file) as f:
-                    data = json.load(f)
-                    self.state.csv_tables_processed = set(data["csv_tables_processed"])
-                    for key, value in data.get("api_enrichment", {}).items():
-                        self.state.api_enrichment[key] = set(value)
-                    self.state.last_update = data.get("last_update")
-                    self.state.errors = data.get("errors", [])
+                data = orjson.loads(self.progress_file.read_bytes())
+                self.state.csv_tables_processed = set(data["csv_tables_processed"])
+                for key, value in data.get("api_enrichment", {}).items():
+                    self.state.api_enrichment[key] = set(value)
+                self.state.last_update = data.get("last_update")
+                self.state.errors = data.get("errors", [])
             except Exception as e:
                 logger.error(f"Failed to load progress: {e}")
 
@@ -72,8 +81,10 @@ class PipelineProgress:
                 "last_update": datetime.utcnow().isoformat(),
                 "errors": self.state.errors,
             }
-            with open(self.progress_file, "w") as f:
-                json.dump(data, f, indent=2)
+            # A crash mid-write must never leave a truncated progress file
+            write_bytes_atomic(
+                self.progress_file, orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            )
         except Exception as e:
             logger.error(f"Failed to save progress: {e}")
 
@@ -147,15 +158,23 @@ class DataPipeline:
             raise ValueError(f"Data directory {v.data_dir} does not exist")
         return v
 
-    async def validate_record(self, record: Dict[str, Any], schema_name: str) -> bool:
+    async def validate_record(
+        self,
+        record: Dict[str, Any],
+        schema_name: str,
+        known_name_ids: Optional[Set[Any]] = None,
+    ) -> bool:
         try:
             if not validate_data(record, self.config.SCHEMAS[schema_name]):
                 return False
 
+            if schema_name in ("observations", "names") and known_name_ids is None:
+                known_name_ids = await self._existing_name_ids([record])
+
             if schema_name == "observations":
-                return await self._validate_observation(record)
+                return await self._validate_observation(record, known_name_ids)
             if schema_name == "names":
-                return await self._validate_name(record)
+                return await self._validate_name(record, known_name_ids)
             return True
 
         except Exception as e:
@@ -164,7 +183,24 @@ class DataPipeline:
             )
             return False
 
-    async def _validate_observation(self, record: Dict[str, Any]) -> bool:
+    async def _existing_name_ids(self, batch: List[Dict[str, Any]]) -> Set[Any]:
+        """Return the referenced name ids that exist, using a single query."""
+        referenced = {
+            record[field]
+            for record in batch
+            for field in ("name_id", "synonym_id")
+            if record.get(field)
+        }
+        if not referenced:
+            return set()
+
+        names_coll = self.db.get_collection("names")
+        cursor = names_coll.find({"_id": {"$in": list(referenced)}}, {"_id": 1})
+        return {doc["_id"] async for doc in cursor}
+
+    async def _validate_observation(
+        self, record: Dict[str, Any], known_name_ids: Set[Any]
+    ) -> bool:
         try:
             if "location" in record:
                 loc = record["location"]
@@ -173,19 +209,19 @@ class DataPipeline:
                         return False
 
             if "when" in record:
-                datetime.strptime(record["when"], "%Y-%m-%d")
+                parse_date(record["when"])
 
-            if "name_id" in record:
-                names_coll = self.db.get_collection("names")
-                if not await names_coll.find_one({"_id": record["name_id"]}):
-                    return False
+            if "name_id" in record and record["name_id"] not in known_name_ids:
+                return False
 
             return True
 
         except Exception:
             return False
 
-    async def _validate_name(self, record: Dict[str, Any]) -> bool:
+    async def _validate_name(
+        self, record: Dict[str, Any], known_name_ids: Set[Any]
+    ) -> bool:
         try:
             if "text_name" in record:
                 name = record["text_name"]
@@ -195,10 +231,8 @@ class DataPipeline:
             if "rank" in record and record["rank"] not in range(1, 101):
                 return False
 
-            if "synonym_id" in record and record["synonym_id"]:
-                names_coll = self.db.get_collection("names")
-                if not await names_coll.find_one({"_id": record["synonym_id"]}):
-                    return False
+            if record.get("synonym_id") and record["synonym_id"] not in known_name_ids:
+                return False
 
             return True
 
@@ -214,17 +248,16 @@ class DataPipeline:
 
     async def download_csv_files(self):
         logger.info("Downloading CSV files...")
-        self.config.data_dir.mkdir(parents=True, exist_ok=True)
-        mo_source = MODataSource()
+        ensure_dir(self.config.data_dir)
         files = {
-            "names": mo_source.NAMES,
-            "observations": mo_source.OBSERVATIONS,
-            "locations": mo_source.LOCATIONS,
-            "images": mo_source.IMAGES,
-            "images_observations": mo_source.IMAGES_OBSERVATIONS,
-            "name_classifications": mo_source.NAME_CLASSIFICATIONS,
-            "name_descriptions": mo_source.NAME_DESCRIPTIONS,
-            "location_descriptions": mo_source.LOCATION_DESCRIPTIONS,
+            "names": MODataSource.NAMES,
+            "observations": MODataSource.OBSERVATIONS,
+            "locations": MODataSource.LOCATIONS,
+            "images": MODataSource.IMAGES,
+            "images_observations": MODataSource.IMAGES_OBSERVATIONS,
+            "name_classifications": MODataSource.NAME_CLASSIFICATIONS,
+            "name_descriptions": MODataSource.NAME_DESCRIPTIONS,
+            "location_descriptions": MODataSource.LOCATION_DESCRIPTIONS,
         }
 
         async with aiohttp.ClientSession() as session:
@@ -236,7 +269,10 @@ class DataPipeline:
                         async with session.get(url) as response:
                             response.raise_for_status()
                             async with aiofiles.open(target_path, "wb") as f:
-                                await f.write(await response.read())
+                                async for chunk in response.content.iter_chunked(
+                                    self.config.CHUNK_SIZE
+                                ):
+                                    await f.write(chunk)
                         logger.info(f"Downloaded {name}.csv")
 
                     except Exception as e:
@@ -267,22 +303,37 @@ class DataPipeline:
                 raise FileNotFoundError(f"CSV file not found: {file_path}")
 
             async for batch in self.csv_processor.process_file(file_path, table_name):
+                # Resolve name references for the whole batch up front instead
+                # of issuing one find_one per record.
+                known_name_ids = (
+                    await self._existing_name_ids(batch)
+                    if table_name in ("observations", "names")
+                    else None
+                )
                 valid_records = [
                     record
                     for record in batch
-                    if await self.validate_record(record, table_name)
+                    if await self.validate_record(record, table_name, known_name_ids)
                 ]
                 self.progress.update_stats(failed=len(batch) - len(valid_records))
 
                 if valid_records:
                     collection = self.db.get_collection(table_name)
-                    await self.db.batch_upsert(collection, valid_records)
-                    self.progress.update_stats(processed=len(valid_records))
+                    skipped_ids = set(
+                        await self.db.batch_upsert(collection, valid_records)
+                    )
+                    written_ids = [
+                        record.get("_id")
+                        for record in valid_records
+                        if record.get("_id") not in skipped_ids
+                    ]
+                    self.progress.update_stats(
+                        processed=len(written_ids),
+                        failed=len(valid_records) - len(written_ids),
+                    )
 
                     if table_name in self.processed_ids:
-                        self.processed_ids[table_name].update(
-                            record["_id"] for record in valid_records
-                        )
+                        self.processed_ids[table_name].update(written_ids)
 
         except Exception as e:
             raise DataProcessingError(f"Failed to process {table_name}: {str(e)}")
@@ -1,8 +1,12 @@
 """Async database operations module."""
 
+import asyncio
 from typing import Any, Dict, List, Optional
+import bson
+import pymongo
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
-from pymongo import UpdateOne
+from pymongo import IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError
 from dataclasses import asdict
 import logging
 
@@ -12,6 +16,8 @@ from src.config import DataConfig
 
 logger = logging.getLogger(__name__)
 
+DUPLICATE_KEY_ERROR = 11000
+
 
 class AsyncDatabase:
     """Async database operations handler."""
@@ -19,6 +25,9 @@ class AsyncDatabase:
     def __init__(self, config: DataConfig):
         self.config = config
         self.client: Optional[AsyncIOMotorClient] = None
+        # Shared by every batch_upsert call so MAX_CONCURRENT_WRITES bounds
+        # bulk writes across concurrent callers, not per call.
+        self._write_slots = asyncio.Semaphore(config.MAX_CONCURRENT_WRITES)
 
     async def connect(self) -> None:
         """Connect to the database."""
@@ -27,6 +36,11 @@ class AsyncDatabase:
             # Ping database to verify connection
             await self.client.admin.command("ping")
             logger.info("Successfully connected to MongoDB")
+            if not (bson.has_c() and pymongo.has_c()):
+                logger.warning(
+                    "pymongo C extensions are unavailable; BSON encoding of bulk "
+                    "writes will fall back to pure Python and be much slower"
+                )
         except Exception as e:
             raise DatabaseError(f"Failed to connect to MongoDB: {e}")
 
@@ -48,37 +62,87 @@ class AsyncDatabase:
         collection: AsyncIOMotorCollection,
         items: List[Any],
         batch_size: Optional[int] = None,
-    ) -> None:
-        """Batch upsert items into collection."""
+    ) -> List[Any]:
+        """Batch upsert items into collection.
+
+        Returns the ``_id`` of every item whose write was skipped because of
+        a duplicate-key conflict on ``_id``.
+        """
         if not items:
-            return
+            return []
 
         batch_size = batch_size or self.config.BATCH_SIZE
-        operations = []
+        skipped_ids: List[Any] = []
+
+        async def flush(operations: List[UpdateOne], ids: List[Any]) -> None:
+            async with self._write_slots:
+                skipped_ids.extend(
+                    await self._bulk_write(collection, operations, ids)
+                )
 
         try:
+            operations = []
+            ids = []
             for item in items:
                 # Convert dataclass instances to dictionaries
                 item_dict = (
                     asdict(item) if hasattr(item, "__dataclass_fields__") else item
                 )
 
+                ids.append(item_dict.get("_id"))
                 operations.append(
-                    UpdateOne(
-                        {"_id": item_dict.get("_id")}, {"$set": item_dict}, upsert=True
-                    )
+                    UpdateOne({"_id": ids[-1]}, {"$set": item_dict}, upsert=True)
                 )
 
-                if len(operations) >= batch_size:
-                    await collection.bulk_write(operations, ordered=False)
-                    operations = []
+            # Batches are independent unordered writes, so keep several in
+            # flight on the connection pool instead of awaiting each in turn.
+            # If one fails, the task group cancels and awaits the others
+            # before the error is reported.
+            async with asyncio.TaskGroup() as group:
+                for start in range(0, len(operations), batch_size):
+                    end = start + batch_size
+                    group.create_task(flush(operations[start:end], ids[start:end]))
 
-            if operations:
-                await collection.bulk_write(operations, ordered=False)
+            return skipped_ids
 
+        except ExceptionGroup as e:
+            raise DatabaseError(f"Batch upsert failed: {e.exceptions[0]}") from e
         except Exception as e:
             raise DatabaseError(f"Batch upsert failed: {e}")
 
+    async def _bulk_write(
+        self,
+        collection: AsyncIOMotorCollection,
+        operations: List[UpdateOne],
+        ids: List[Any],
+    ) -> List[Any]:
+        """Run an unordered bulk write, tolerating ``_id`` duplicate-key conflicts.
+
+        Unordered writes apply every operation that can succeed; collisions are
+        reported in the result instead of aborting the batch. Only conflicts on
+        ``_id`` (concurrent upserts of the same document) are tolerated, and
+        the ``_id`` of each skipped operation, looked up in ``ids`` (parallel
+        to ``operations``), is returned. Any other unique
+        index collision would silently drop a distinct document, so it raises.
+        """
+        try:
+            await collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            if e.details.get("writeConcernErrors") or any(
+                err.get("code") != DUPLICATE_KEY_ERROR
+                or set(err.get("keyValue") or {}) != {"_id"}
+                for err in write_errors
+            ):
+                raise
+            skipped_ids = [ids[err["index"]] for err in write_errors]
+            logger.warning(
+                f"Skipped {len(skipped_ids)} duplicate-key writes in "
+                f"{collection.name}: {[err['keyValue'] for err in write_errors]}"
+            )
+            return skipped_ids
+        return []
+
     @measure_performance
     async def batch_delete(
         self, collection: AsyncIOMotorCollection, filter_query: Dict[str, Any]
@@ -94,10 +158,11 @@ class AsyncDatabase:
     async def ensure_indexes(
         self, collection: AsyncIOMotorCollection, indexes: List[Dict[str, Any]]
     ) -> None:
-        """Create indexes if they don't exist."""
+        """Create indexes if they don't exist, in a single createIndexes command."""
+        if not indexes:
+            return
         try:
-            for index in indexes:
-                await collection.create_index(**index)
+            await collection.create_indexes([IndexModel(**index) for index in indexes])
         except Exception as e:
             raise DatabaseError(f"Failed to create indexes: {e}")
 
@@ -6,7 +6,7 @@ import logging
 from pathlib import Path
 from typing import Optional, Dict
 
-from src.config import DataConfig, MODataSource
+from src.config import DataConfig, MODataSource, ensure_dir
 from src.exceptions import FileProcessingError
 from src.monitoring import measure_performance
 
@@ -22,8 +22,21 @@ class MODownloader:
 
     async def __aenter__(self):
         """Set up async context."""
+        # One pooled connector for every download so TCP/TLS setup is
+        # paid once per host instead of once per file.
+        connector = aiohttp.TCPConnector(
+            limit=self.config.CONNECTION_POOL_SIZE,
+            keepalive_timeout=30,
+            ttl_dns_cache=300,
+        )
         self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.config.DOWNLOAD_TIMEOUT)
+            connector=connector,
+            # No cap on the whole transfer: large CSVs downloading side by
+            # side can legitimately take many minutes. A stalled connection
+            # is caught by the read timeout instead.
+            timeout=aiohttp.ClientTimeout(
+                total=None, sock_connect=5, sock_read=self.config.DOWNLOAD_TIMEOUT
+            ),
         )
         return self
 
@@ -51,7 +64,7 @@ class MODownloader:
             logger.info(f"Skipping existing file: {output_path}")
             return False
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(output_path.parent)
 
         for attempt in range(self.config.MAX_RETRIES):
             try:
@@ -104,18 +117,26 @@ class MODownloader:
             "location_descriptions": MODataSource.LOCATION_DESCRIPTIONS,
         }
 
-        results = {}
-        async with self:  # Use context manager for session management
-            for schema_name, url in downloads.items():
-                output_path = self.config.DATA_DIR / f"{schema_name}.csv"
+        fetched: Dict[str, Path] = {}
+        semaphore = asyncio.Semaphore(self.config.MAX_CONCURRENT_DOWNLOADS)
+
+        async def fetch(schema_name: str, url: str) -> None:
+            output_path = self.config.DATA_DIR / f"{schema_name}.csv"
+            async with semaphore:
                 try:
                     downloaded = await self.download_file(url, output_path, force)
                     if downloaded or output_path.exists():
-                        results[schema_name] = output_path
+                        fetched[schema_name] = output_path
                 except Exception as e:
                     logger.error(f"Failed to download {schema_name}: {e}")
 
-        return results
+        async with self:  # Use context manager for session management
+            await asyncio.gather(
+                *(fetch(schema_name, url) for schema_name, url in downloads.items())
+            )
+
+        # Keep the declared download order regardless of completion order
+        return {name: fetched[name] for name in downloads if name in fetched}
 
 
 async def download_mo_data(config: DataConfig, force: bool = False) -> Dict[str, Path]:
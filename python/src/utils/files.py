@@ -0,0 +1,25 @@
+"""File-writing utilities."""
+
+import os
+from pathlib import Path
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write data to path so that a crash leaves either the old or new file.
+
+    The data goes to a temporary file beside the target, which is flushed to
+    disk before it replaces the target; the directory is then synced so the
+    rename itself survives a power loss.
+    """
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+    if os.name != "nt":  # Windows can't open a directory to sync it
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
@@ -0,0 +1,149 @@
+"""Tests for the Mushroom Observer API mapper."""
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import orjson
+import pytest
+
+import api_mapper
+from api_mapper import MOApiMapper
+
+
+class FakeResponse:
+    """Minimal aiohttp response usable as an async context manager."""
+
+    status = 200
+
+    async def read(self) -> bytes:
+        return b'{"results": [1, 2, 3]}'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Fake the limiter's clock; sleeping advances it instead of waiting."""
+    clock = [0.0]
+    recorded = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        recorded.append(seconds)
+        clock[0] += seconds
+        await real_sleep(0)
+
+    monkeypatch.setattr(api_mapper, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+@pytest.fixture
+def mapper(sleeps, tmp_path):
+    mapper = MOApiMapper(Mock(), tmp_path)
+    mapper.session = Mock()
+    mapper.session.get = Mock(return_value=FakeResponse())
+    return mapper
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_paces(mapper, sleeps):
+    for _ in range(mapper.REQUEST_BURST):
+        await mapper._wait_for_rate_limit()
+    assert sleeps == []
+
+    await mapper._wait_for_rate_limit()
+    await mapper._wait_for_rate_limit()
+    assert sleeps == [pytest.approx(mapper.REQUEST_DELAY)] * 2
+
+    # Idle time refills the bucket, so the next two go out without waiting
+    await asyncio.sleep(2 * mapper.REQUEST_DELAY)
+    sleeps.clear()
+    await mapper._wait_for_rate_limit()
+    await mapper._wait_for_rate_limit()
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_endpoint_url_reused_across_throttled_requests(
+    mapper, sleeps, monkeypatch
+):
+    url_factory = Mock(wraps=api_mapper.URL)
+    monkeypatch.setattr(api_mapper, "URL", url_factory)
+
+    for _ in range(mapper.REQUEST_BURST * 2):
+        response = await mapper._make_request("names", {"detail": "low"})
+        assert response == {"results": [1, 2, 3]}
+
+    # Requests after the burst had to wait for tokens
+    assert len(sleeps) == mapper.REQUEST_BURST
+    # ...and still went to the URL built for the first request
+    url_factory.assert_called_once_with(MOApiMapper.BASE_URL)
+    cached = mapper._endpoint_urls["names"]
+    assert str(cached) == f"{MOApiMapper.BASE_URL}/names"
+    assert all(call.args[0] is cached for call in mapper.session.get.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_map_endpoints_settles_sibling_requests_before_failing(tmp_path):
+    mapper = MOApiMapper(Mock(), tmp_path)
+
+    async def make_request(endpoint, params):
+        if endpoint == "names":
+            raise api_mapper.DataProcessingError("API request failed: 500")
+        await asyncio.Event().wait()
+
+    mapper._make_request = make_request
+
+    with pytest.raises(api_mapper.DataProcessingError, match="500"):
+        await mapper.map_endpoints()
+
+    # No request may still be running once the error is reported
+    current = asyncio.current_task()
+    assert all(task.done() for task in asyncio.all_tasks() if task is not current)
+
+
+@pytest.mark.asyncio
+async def test_discover_ids_lists_every_record_type(mapper, tmp_path):
+    await mapper.discover_ids()
+
+    saved = orjson.loads((tmp_path / "example_ids.json").read_bytes())
+    assert list(saved) == list(MOApiMapper.EXAMPLE_ID_TYPES)
+    assert saved["names"] == [1, 2, 3]
+    assert saved["sequences"] == saved["external_links"] == []
+
+
+@pytest.mark.parametrize(
+    "age, cached",
+    [(60, True), (MOApiMapper.HELP_CACHE_TTL + 60, False), (None, False)],
+    ids=["fresh", "expired", "missing"],
+)
+@pytest.mark.asyncio
+async def test_cached_test_endpoint_honours_ttl(tmp_path, age, cached):
+    mapper = MOApiMapper(Mock(), tmp_path)
+    mapper.session = Mock()
+    mapper.session.get = Mock(return_value=FakeResponse())
+    saved = tmp_path / "names_help.json"
+    if age is not None:
+        saved.write_bytes(b'{"results": ["cached"]}')
+        mtime = time.time() - age
+        os.utime(saved, (mtime, mtime))
+
+    response = await mapper.cached_test_endpoint(
+        "names", {"help": "1"}, "names_help", ttl=MOApiMapper.HELP_CACHE_TTL
+    )
+
+    if cached:
+        assert response == {"results": ["cached"]}
+        mapper.session.get.assert_not_called()
+    else:
+        assert response == {"results": [1, 2, 3]}
+        mapper.session.get.assert_called_once()
+        assert orjson.loads(saved.read_bytes()) == response
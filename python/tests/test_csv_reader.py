@@ -0,0 +1,76 @@
+"""Tests for reading CSV files into record batches."""
+
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from src.data_csv import _read_csv_in_batches
+
+
+@pytest.fixture
+def config():
+    return SimpleNamespace(batch_size=10, null_values={"", "NA", "NULL", "None"})
+
+
+async def read_records(config, file_path, boolean_columns=()):
+    return [
+        record
+        async for batch in _read_csv_in_batches(config, file_path, boolean_columns)
+        for record in batch
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_csv_coerces_only_boolean_columns(config, tmp_path):
+    csv_file = tmp_path / "observations.csv"
+    csv_file.write_text(
+        "id,is_collection_location,specimen,notes\n"
+        "1,true,yes,yes\n"
+        "2,F,no,false\n"
+        "3,maybe,1,true\n"
+        "4,,NA,\n"
+    )
+
+    records = await read_records(
+        config, csv_file, ["is_collection_location", "specimen"]
+    )
+
+    assert [r["is_collection_location"] for r in records[:3]] == [
+        True,
+        False,
+        "maybe",
+    ]
+    assert [r["specimen"] for r in records[:3]] == [True, False, True]
+    # Columns not declared boolean keep their text, whatever it spells
+    assert [r["notes"] for r in records[:3]] == ["yes", "false", "true"]
+    # Missing cells become real None, never NaN or pd.NA
+    assert all(records[3][column] is None for column in records[3] if column != "id")
+
+
+@pytest.mark.asyncio
+async def test_read_csv_skips_and_counts_empty_rows(config, tmp_path):
+    csv_file = tmp_path / "names.csv"
+    csv_file.write_text("id,text_name\n1,Agaricus\n,\n2,Amanita\n,NA\n")
+    stats = Counter()
+
+    batches = [
+        batch async for batch in _read_csv_in_batches(config, csv_file, stats=stats)
+    ]
+
+    assert [r["id"] for batch in batches for r in batch] == [1, 2]
+    assert stats == {"rows": 4, "empty_rows": 2}
+
+
+@pytest.mark.asyncio
+async def test_read_csv_gappy_id_column_yields_python_ints(config, tmp_path):
+    csv_file = tmp_path / "observations.csv"
+    csv_file.write_text("id,name_id\n1,10\n2,\n3,30\n")
+
+    records = await read_records(config, csv_file)
+
+    name_ids = [r["name_id"] for r in records]
+    assert name_ids == [10, None, 30]
+    # Plain Python values only, so nothing numpy or pd.NA reaches BSON
+    assert [type(value) for value in name_ids] == [int, type(None), int]
+    assert all(type(r["id"]) is int for r in records)
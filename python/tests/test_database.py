@@ -0,0 +1,111 @@
+"""Tests for the async database layer."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from src.database import DUPLICATE_KEY_ERROR, AsyncDatabase
+from src.exceptions import DatabaseError
+
+
+@pytest.fixture
+def db():
+    config = SimpleNamespace(BATCH_SIZE=2, MAX_CONCURRENT_WRITES=8)
+    return AsyncDatabase(config)
+
+
+@pytest.fixture
+def collection():
+    collection = Mock()
+    collection.name = "names"
+    collection.bulk_write = AsyncMock()
+    return collection
+
+
+@pytest.mark.asyncio
+async def test_batch_upsert_settles_sibling_writes_before_failing(db, collection):
+    async def bulk_write(operations, ordered):
+        if operations[0] == UpdateOne({"_id": 0}, {"$set": {"_id": 0}}, upsert=True):
+            raise RuntimeError("write failed")
+        await asyncio.sleep(1)
+
+    collection.bulk_write.side_effect = bulk_write
+    items = [{"_id": i} for i in range(6)]
+
+    with pytest.raises(DatabaseError, match="write failed"):
+        await db.batch_upsert(collection, items)
+
+    # No bulk write may still be running once the error is reported
+    current = asyncio.current_task()
+    assert all(task.done() for task in asyncio.all_tasks() if task is not current)
+
+
+def bulk_write_error(*errors):
+    return BulkWriteError(
+        {
+            "writeErrors": [
+                {"index": index, "code": code, "keyValue": key_value}
+                for index, code, key_value in errors
+            ],
+            "writeConcernErrors": [],
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_upsert_skips_id_conflicts(db, collection):
+    collection.bulk_write.side_effect = bulk_write_error(
+        (1, DUPLICATE_KEY_ERROR, {"_id": 2})
+    )
+
+    skipped = await db.batch_upsert(collection, [{"_id": 1}, {"_id": 2}])
+
+    assert skipped == [2]
+    collection.bulk_write.assert_awaited_once()
+    assert collection.bulk_write.await_args.kwargs == {"ordered": False}
+
+
+@pytest.mark.asyncio
+async def test_batch_upsert_raises_conflicts_on_other_unique_keys(db, collection):
+    collection.bulk_write.side_effect = bulk_write_error(
+        (0, DUPLICATE_KEY_ERROR, {"names.text_name": "Amanita"})
+    )
+
+    with pytest.raises(DatabaseError):
+        await db.batch_upsert(collection, [{"_id": 1}, {"_id": 2}])
+
+
+@pytest.mark.asyncio
+async def test_batch_upsert_raises_other_write_errors(db, collection):
+    collection.bulk_write.side_effect = bulk_write_error(
+        (0, DUPLICATE_KEY_ERROR, {"_id": 1}), (1, 121, None)
+    )
+
+    with pytest.raises(DatabaseError):
+        await db.batch_upsert(collection, [{"_id": 1}, {"_id": 2}])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batch_upserts_share_the_write_limit(collection):
+    db = AsyncDatabase(SimpleNamespace(BATCH_SIZE=1, MAX_CONCURRENT_WRITES=2))
+    in_flight = peak = 0
+
+    async def bulk_write(operations, ordered):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    collection.bulk_write.side_effect = bulk_write
+
+    await asyncio.gather(
+        db.batch_upsert(collection, [{"_id": 1}, {"_id": 2}]),
+        db.batch_upsert(collection, [{"_id": 3}, {"_id": 4}]),
+    )
+
+    assert peak == 2
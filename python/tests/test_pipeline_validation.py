@@ -0,0 +1,63 @@
+"""Tests for the pipeline's name-reference checks."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+data_pipeline = pytest.importorskip("src.data_pipeline")
+
+
+class FakeCursor:
+    """Async iterator over a fixed list of documents."""
+
+    def __init__(self, docs):
+        self._docs = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    existing = {1, 2}
+    names = Mock()
+    names.find = Mock(
+        side_effect=lambda query, projection: FakeCursor(
+            {"_id": _id} for _id in query["_id"]["$in"] if _id in existing
+        )
+    )
+    monkeypatch.setattr(data_pipeline, "validate_data", lambda record, schema: True)
+
+    pipeline = data_pipeline.DataPipeline.__new__(data_pipeline.DataPipeline)
+    pipeline.config = SimpleNamespace(SCHEMAS={"observations": {}, "names": {}})
+    pipeline.db = Mock(get_collection=Mock(return_value=names))
+    return pipeline
+
+
+@pytest.mark.asyncio
+async def test_name_references_checked_with_one_query_per_batch(pipeline):
+    observations = [{"_id": 10, "name_id": 1}, {"_id": 11, "name_id": 3}]
+    names = [
+        {"_id": 20, "text_name": "Agaricus campestris", "synonym_id": 2},
+        {"_id": 21, "text_name": "Agaricus arvensis", "synonym_id": 4},
+    ]
+
+    known = await pipeline._existing_name_ids(observations + names)
+    results = [
+        await pipeline.validate_record(record, "observations", known)
+        for record in observations
+    ] + [await pipeline.validate_record(record, "names", known) for record in names]
+
+    names_coll = pipeline.db.get_collection.return_value
+    names_coll.find.assert_called_once()
+    assert sorted(names_coll.find.call_args.args[0]["_id"]["$in"]) == [1, 2, 3, 4]
+    assert known == {1, 2}
+    # Unknown name_id and synonym_id are rejected; known ones pass
+    assert results == [True, False, True, False]
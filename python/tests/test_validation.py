@@ -0,0 +1,60 @@
+"""Tests for CSV record validation."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.data_csv import (
+    DateValidator,
+    IdValidator,
+    StringValidator,
+    _is_valid_date,
+    _validation_pool,
+    validate_with_schema,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2023-01-01", True),
+        ("2023-02-29", False),
+        ("2023/01/01", False),
+        ("1677-09-22", True),
+        ("2262-04-11", True),
+        # Outside the pandas Timestamp range, as pd.to_datetime rejects them
+        ("1677-09-21", False),
+        ("0001-01-01", False),
+        ("1500-06-01", False),
+        ("9999-12-31", False),
+    ],
+)
+def test_is_valid_date_iso_fast_path(value, expected):
+    assert _is_valid_date(value, "%Y-%m-%d") is expected
+    assert DateValidator("%Y-%m-%d").validate(value)[0] is expected
+
+
+def test_validate_with_schema_warns_only_for_unknown_validators():
+    validators = {"id": IdValidator(), "string": StringValidator()}
+    schema = {
+        "id": {"validators": ["id"]},
+        "name": {"validators": ["string"]},
+        "rank": {"validators": ["taxon_rank"]},
+    }
+
+    result = validate_with_schema({"id": "12", "name": "Agaricus"}, schema, validators)
+    assert result.is_valid
+    assert result.errors == []
+    assert result.warnings == ["Unknown validator: taxon_rank for field rank"]
+
+    result = validate_with_schema({"id": "x", "name": 5}, schema, validators)
+    assert not result.is_valid
+    assert len(result.errors) == 2
+    assert len(result.warnings) == 1
+
+
+def test_validation_pool_skipped_on_single_cpu(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 1)
+
+    with _validation_pool(SimpleNamespace(validation_workers=None)) as executor:
+        assert executor is None